@@ -24,6 +24,7 @@ import seaborn as sns
 import matplotlib
 import matplotlib.pyplot as plt
 import matplotlib.ticker as mticker
+import matplotlib.colors as mcolors
 import matplotlib.gridspec as gridspec
 import colorcet as cc  # not used but adds colorcet colormaps to be found by matplotlib.cc.get_colormap()
 
@@ -31,10 +32,14 @@ from cartopy import config as cconfig
 import cartopy.feature as cfeature
 from cartopy.mpl.gridliner import LONGITUDE_FORMATTER, LATITUDE_FORMATTER
 
+import functools
+import textwrap
 import warnings
 
 cconfig['data_dir'] = os.path.join(os.path.dirname(__file__), 'cartopy')
 
+_grid_intervals = np.asarray(globals.grid_intervals)
+
 
 def boxplot(df, varmeta, title=None, label=None, print_stat=globals.boxplot_printnumbers,
             watermark_pos=globals.watermark_pos, figsize=None,
@@ -82,36 +87,53 @@ def boxplot(df, varmeta, title=None, label=None, print_stat=globals.boxplot_prin
         DESCRIPTION.
 
     """
-    # === select only relevant variables, creating a view of the passed DataFrame.
-    # This preserves also renaming the columns of the original DataFrame.
-    df = df[varmeta]
+    # === select only relevant variables ===
+    # one column per variable. The data is only needed as array, so no DataFrame is built.
+    data = np.column_stack([df[var].to_numpy() for var in varmeta])
+
+    # === box statistics ===
+    bxpstats = _get_bxpstats(data)
 
-    # === rename columns = label of boxes ===
+    # === label of boxes ===
     if print_stat:
-        df.columns = ['{0}\n({1})\nmedian: {2:.3g}\nstd. dev.: {3:.3g}\nN obs.: {4:d}'.format(
+        std = np.nanstd(data, axis=0, ddof=1)
+        n_obs = np.count_nonzero(~np.isnan(data), axis=0)
+        labels = ['{0}\n({1})\nmedian: {2:.3g}\nstd. dev.: {3:.3g}\nN obs.: {4:d}'.format(
             varmeta[var]['ds_pretty_name'],
             varmeta[var]['ds_version_pretty_name'],
-            df[var].median(),
-            df[var].std(),
-            df[var].count()) for var in varmeta]
+            bxpstats[i]['med'],
+            std[i],
+            n_obs[i]) for i, var in enumerate(varmeta)]
     else:
-        df.columns = ['{}\n{}'.format(
+        labels = ['{}\n{}'.format(
             varmeta[var]['ds_pretty_name'],
             varmeta[var]['ds_version_pretty_name']) for var in varmeta]
+    for stats, box_label in zip(bxpstats, labels):
+        stats['label'] = box_label
 
     # === plot ===
     if not figsize:
         # figsize = globals.boxplot_figsize
-        figsize = [globals.boxplot_width*(1+len(df.columns)), globals.boxplot_height]
+        figsize = [globals.boxplot_width*(1+len(labels)), globals.boxplot_height]
     fig, ax = plt.subplots(figsize=figsize, dpi=dpi)
     sns.set_style("whitegrid")  # TODO: Bug. does not work for the first plot (test_boxplot_ISMN_default()) for some strange reason!!!
-    ax = sns.boxplot(data=df, ax=ax, width=0.15, showfliers=False, color='white')
-    sns.despine()  # remove ugly spines (=border around plot) right and top.
+    # draw the boxes from precomputed statistics, styled like seaborn.boxplot(color='white').
+    gray = '#999999'
+    linewidth = plt.rcParams['lines.linewidth']
+    lineprops = dict(color=gray, linewidth=linewidth, linestyle='-')
+    ax.bxp(bxpstats, positions=np.arange(len(labels)), widths=0.15,
+           showfliers=False, patch_artist=True,
+           boxprops=dict(facecolor='white', edgecolor=gray, linewidth=linewidth, zorder=.9),
+           whiskerprops=lineprops, capprops=lineprops, medianprops=lineprops)
+    ax.set_xlim(-.5, len(labels) - .5)
+    ax.xaxis.grid(False)
+    ax.spines['right'].set_visible(False)  # remove ugly spines (=border around plot) right and top.
+    ax.spines['top'].set_visible(False)
 
     # === style ===
     globmeta = _get_globmeta(varmeta)
     metric = globmeta['metric']
-    ax.set_ylim(get_value_range(df, metric))
+    ax.set_ylim(get_value_range(data, metric))
     if not label:
         label = (globals._metric_name[metric] +
                  globals._metric_description[metric].format(globals._metric_units[globmeta['ref']]))
@@ -120,30 +142,15 @@ def boxplot(df, varmeta, title=None, label=None, print_stat=globals.boxplot_prin
     # === generate title with automatic line break ===
     if add_title:
         if not title:
-            max_title_len = globals.boxplot_title_len * len(df.columns)
             if globmeta['metric'] == 'n_obs':  # special case n_obs.
-                title = list()  # each list element is a line in the plot title
-                title.append(
-                    'Number of spacial and temporal matches between {} ({})'.format(globmeta['ref_pretty_name'],
-                                                                                    globmeta['ref_version_pretty_name']))
-                for name in varmeta['n_obs']['ds_pretty_name']:  # TODO: have a look at parawrap (https://www.tutorialspoint.com/python/python_text_wrapping) or textwrap (https://www.geeksforgeeks.org/textwrap-text-wrapping-filling-python/)
-                    to_append = '{}, '.format(name)
-                    if len(title[-1] + to_append) <= max_title_len:  # line not to long: add to current line
-                        title[-1] += to_append
-                    else:  # add to next line
-                        title.append(to_append)
+                header = 'Number of spacial and temporal matches between {} ({}) and'.format(
+                    globmeta['ref_pretty_name'], globmeta['ref_version_pretty_name'])
+                names = varmeta['n_obs']['ds_pretty_name']  # list of all other datasets
             else:
-                title = list()  # each list element is a line in the plot title
-                title.append(
-                    'Comparing {} ({}) to '.format(globmeta['ref_pretty_name'], globmeta['ref_version_pretty_name']))
-                for var in varmeta:
-                    to_append = '{}, '.format(varmeta[var]['ds_pretty_name'])
-                    if len(title[-1] + to_append) <= max_title_len:  # line not to long: add to current line
-                        title[-1] += to_append
-                    else:  # add to next line
-                        title.append(to_append)
-            title = '\n'.join(title)[:-2]  # join lines together and remove last ', '
-            title = ' and '.join(title.rsplit(', ', 1))  # replace last ', ' with ' and '
+                header = 'Comparing {} ({}) to'.format(globmeta['ref_pretty_name'],
+                                                       globmeta['ref_version_pretty_name'])
+                names = [varmeta[var]['ds_pretty_name'] for var in varmeta]
+            title = _make_boxplot_title(header, names, globals.boxplot_title_len * len(labels))
         ax.set_title(title, pad=title_pad)
 
     # === watermark ===
@@ -153,6 +160,33 @@ def boxplot(df, varmeta, title=None, label=None, print_stat=globals.boxplot_prin
     return fig, ax
 
 
+def _make_boxplot_title(header, names, width):
+    """
+    Put header in the first line and the names, joined as 'A, B and C', in the following lines.
+    The lines with the names are wrapped at width chars, without splitting a name.
+    """
+    names = [name.replace(' ', '\xa0') for name in names]  # textwrap does not break at non-breaking spaces
+    if len(names) > 1:
+        names = [', '.join(names[:-1]), names[-1]]
+    lines = textwrap.wrap(' and '.join(names), width=width, break_long_words=False, break_on_hyphens=False)
+    return '\n'.join([header] + lines).replace('\xa0', ' ')
+
+
+def _get_bxpstats(arr, whis=1.5):
+    """
+    Box statistics for matplotlib.axes.Axes.bxp, computed for all columns of arr at once.
+    The whiskers extend to the most extreme data within whis times the inter-quartile range.
+    """
+    with warnings.catch_warnings():  # columns with only nan values give nan statistics
+        warnings.simplefilter('ignore', category=RuntimeWarning)
+        q1, med, q3 = _nanquantile(arr, [0.25, 0.5, 0.75])
+        iqr = q3 - q1
+        whislo = np.nanmin(np.where(arr >= q1 - whis * iqr, arr, np.nan), axis=0)
+        whishi = np.nanmax(np.where(arr <= q3 + whis * iqr, arr, np.nan), axis=0)
+    return [{'med': med[i], 'q1': q1[i], 'q3': q3[i], 'whislo': whislo[i], 'whishi': whishi[i]}
+            for i in range(arr.shape[1])]
+
+
 def mapplot(df, var, meta, title=None, label=None, plot_extent=None,
             colormap=None, figsize=globals.map_figsize, dpi=globals.dpi,
             projection=None, watermark_pos=globals.watermark_pos,
@@ -215,11 +249,16 @@ def mapplot(df, var, meta, title=None, label=None, plot_extent=None,
 
     if not colormap:
         colormap = globals._colormaps[meta['metric']]
-    cmap = plt.cm.get_cmap(colormap)
+    cmap = _get_cmap(colormap)
 
     # === scatter or mapplot ===
-    if (meta['ds'] in globals.scattered_datasets or
-            meta['ref'] in globals.scattered_datasets):  # === scatterplot ===
+    scattered = (meta['ds'] in globals.scattered_datasets or
+                 meta['ref'] in globals.scattered_datasets)
+    grids = None
+    if scattered and len(df) > globals.rasterize_threshold:  # many points on a grid are drawn faster as image.
+        grids = _is_gridded(df)
+        scattered = grids is None
+    if scattered:  # === scatterplot ===
         # === coordiniate range ===
         if not plot_extent:
             plot_extent = get_plot_extent(df)
@@ -227,20 +266,34 @@ def mapplot(df, var, meta, title=None, label=None, plot_extent=None,
         # === marker size ===
         markersize = globals.markersize ** 2  # in points**2
 
+        # === colors ===
+        # map the colors only once, instead of on every draw of the figure.
+        values = df[var].to_numpy()
+        valid = np.isfinite(values)  # nan values are not plotted.
+        norm = mcolors.Normalize(vmin=v_min, vmax=v_max)
+        colors = cmap(norm(values[valid]))
+        if np.count_nonzero(valid) > globals.markeredge_max_points:  # stroking the edge of each marker is slow
+            edge_kwargs = {'edgecolors': 'none'}
+        else:
+            edge_kwargs = {'edgecolors': 'black', 'linewidths': 0.1}
+
         # === plot ===
         lat, lon = globals.index_names
-        im = ax.scatter(df[lon], df[lat], c=df[var],
-                        cmap=cmap, s=markersize, vmin=v_min, vmax=v_max, edgecolors='black',
-                        linewidths=0.1, zorder=2, transform=globals.data_crs)
+        ax.scatter(df[lon].to_numpy()[valid], df[lat].to_numpy()[valid], c=colors,
+                   s=markersize, zorder=2, transform=globals.data_crs, **edge_kwargs)
+        im = plt.cm.ScalarMappable(norm=norm, cmap=cmap)  # colors are already mapped. needed for the colorbar.
+        im.set_array(values[valid])
     else:  # === mapplot ===
+        # === prepare data ===
+        zz, zz_extent = geotraj_to_geo2d(df, var, grids=grids)
+
         # === coordiniate range ===
         if not plot_extent:
-            plot_extent = get_plot_extent(df, grid=True)
-
-        # === prepare data ===
-        zz, zz_extent = geotraj_to_geo2d(df, var)
+            plot_extent = _pad_extent(list(zz_extent))  # reuse the grid instead of searching it again
 
         # === plot ===
+        if ax.projection != globals.data_crs:  # image gets warped: set extent first, so only the visible part is warped
+            ax.set_extent(plot_extent)
         im = ax.imshow(zz, cmap=cmap, vmin=v_min, vmax=v_max,
                        interpolation='nearest', origin='lower',
                        extent=zz_extent,
@@ -248,7 +301,7 @@ def mapplot(df, var, meta, title=None, label=None, plot_extent=None,
 
     # === add colorbar ===
     if add_cbar:
-        _make_cbar(fig, im, cax, df[var], v_min, v_max, meta, label)
+        _make_cbar(fig, im, cax, meta, label)
 
     # === style ===
     if add_title:
@@ -256,7 +309,11 @@ def mapplot(df, var, meta, title=None, label=None, plot_extent=None,
     style_map(ax, plot_extent, **style_kwargs)
 
     # === layout ===
-    fig.canvas.draw()  # very slow. necessary bcs of a bug in cartopy: https://github.com/SciTools/cartopy/issues/1207
+    # drawing is necessary bcs of a bug in cartopy: https://github.com/SciTools/cartopy/issues/1207
+    if hasattr(fig, 'draw_without_rendering'):  # matplotlib >= 3.5: updates the layout without rasterizing the figure.
+        fig.draw_without_rendering()
+    else:
+        fig.canvas.draw()  # very slow.
     plt.tight_layout()  # pad=1)  # pad=0.5,h_pad=1,w_pad=1,rect=(0, 0, 1, 1))
 
     # === watermark ===
@@ -273,25 +330,39 @@ def _float_gcd(a, b, atol=1e-08):
     return a
 
 
-def _get_grid(a):
+def _get_grid(a, atol=1e-08):
     "Find the stepsize of the grid behind a and return the parameters for that grid axis."
     a = np.unique(a)  # get unique values and sort
     das = np.unique(np.diff(a))  # get unique stepsizes and sort
     da = das[0]  # get smallest stepsize
-    for d in das[1:]:  # make sure, all stepsizes are multiple of da
-        da = _float_gcd(d, da)
+    if np.abs(np.rint(das / da) * da - das).max() > atol:  # not all stepsizes are multiple of da
+        for d in das[1:]:
+            da = _float_gcd(d, da)
     a_min = a[0]
     a_max = a[-1]
-    len_a = int((a_max - a_min) / da + 1)
+    len_a = int(np.rint((a_max - a_min) / da)) + 1
     return a_min, a_max, da, len_a
 
 
+def _is_gridded(df, index=globals.index_names):
+    """
+    Whether the points in df fill at least globals.grid_min_coverage of the grid cells spanned by them.
+    Returns the grids (x_grid, y_grid) as returned by _get_grid, so they can be passed on
+    to geotraj_to_geo2d, or None if the points are not gridded.
+    """
+    x_grid = _get_grid(df[index[1]])
+    y_grid = _get_grid(df[index[0]])
+    if len(df) >= globals.grid_min_coverage * x_grid[3] * y_grid[3]:
+        return x_grid, y_grid
+    return None
+
+
 def _value2index(a, a_min, da):
     "Return the indexes corresponding to a. a and the returned index is a numpy array."
-    return ((a - a_min) / da).astype('int')
+    return np.rint((a - a_min) / da).astype(np.intp)  # round, truncating misplaces values like 0.99999
 
 
-def geotraj_to_geo2d(df, var, index=globals.index_names):
+def geotraj_to_geo2d(df, var, index=globals.index_names, grids=None):
     """
     Converts geotraj (list of lat, lon, value) to a regular grid over lon, lat.
     The data in df needs to be sampled from a regular grid, the order does not matter.
@@ -307,6 +378,9 @@ def geotraj_to_geo2d(df, var, index=globals.index_names):
     index : tuple, optional
         Tuple containing the names of lattitude and longitude index. Usually ('lat','lon')
         The default is globals.index_names
+    grids : tuple, optional
+        (x_grid, y_grid) as returned by _get_grid for lon and lat, if already known.
+        If None, the grids are computed from df. The default is None.
 
     Returns
     -------
@@ -317,12 +391,13 @@ def geotraj_to_geo2d(df, var, index=globals.index_names):
     data_extent : tuple
         (x_min, x_max, y_min, y_max) in Data coordinates.
     """
-    xx = df[index[1]]  # lon
-    yy = df[index[0]]  # lat
-    data = df[var]
+    xx = df[index[1]].to_numpy()  # lon
+    yy = df[index[0]].to_numpy()  # lat
+    data = df[var].to_numpy()
 
-    x_min, x_max, dx, len_x = _get_grid(xx)
-    y_min, y_max, dy, len_y = _get_grid(yy)
+    if grids is None:
+        grids = _get_grid(xx), _get_grid(yy)
+    (x_min, x_max, dx, len_x), (y_min, y_max, dy, len_y) = grids
 
     ii = _value2index(yy, y_min, dy)
     jj = _value2index(xx, x_min, dx)
@@ -344,8 +419,8 @@ def get_value_range(ds, metric=None, force_quantile=False, quantiles=[0.025, 0.9
 
     Parameters
     ----------
-    ds : (pandas.Series | pandas.DataFrame)
-        Series holding the data
+    ds : (pandas.Series | pandas.DataFrame | numpy.ndarray)
+        Series holding the data. The columns of a DataFrame or 2D array are treated as separate variables.
     metric : (str | None), optional
         name of the metric (e.g. 'R'). None equals to force_quantile=True.
         The default is None.
@@ -398,11 +473,12 @@ def get_value_range(ds, metric=None, force_quantile=False, quantiles=[0.025, 0.9
 
 def get_quantiles(ds, quantiles):
     """
-    Gets lower and upper quantiles from pandas.Series or pandas.DataFrame
+    Gets lower and upper quantiles from pandas.Series, pandas.DataFrame or numpy.ndarray.
+    For a DataFrame or 2D array, the quantiles of each column are taken.
 
     Parameters
     ----------
-    ds : (pandas.Series | pandas.DataFrame)
+    ds : (pandas.Series | pandas.DataFrame | numpy.ndarray)
         Input data.
     quantiles : list
         quantile of data to include in the range
@@ -415,13 +491,35 @@ def get_quantiles(ds, quantiles):
         upper quantile.
 
     """
-    q = ds.quantile(quantiles)
-    if isinstance(ds, pd.Series):
-        return q.iloc[0], q.iloc[1]
-    elif isinstance(ds, pd.DataFrame):
-        return min(q.iloc[0]), max(q.iloc[1])
-    else:
-        raise TypeError("Inappropriate argument type. 'ds' must be pandas.Series or pandas.DataFrame.")
+    if isinstance(ds, (pd.Series, pd.DataFrame)):
+        ds = ds.to_numpy()
+    elif not isinstance(ds, np.ndarray):
+        raise TypeError("Inappropriate argument type. 'ds' must be pandas.Series, pandas.DataFrame or numpy.ndarray.")
+    q = _nanquantile(ds, quantiles)  # quantiles of each column
+    return float(np.nanmin(q[0])), float(np.nanmax(q[1]))
+
+
+def _nanquantile(a, quantiles):
+    """
+    Same as numpy.nanquantile(a, quantiles, axis=0) with linear interpolation.
+    All columns are sorted at once instead of handling the columns one by one,
+    which is much faster for the small arrays that are usually plotted.
+    """
+    a = np.sort(a, axis=0)  # nan values are sorted to the end
+    n = np.count_nonzero(~np.isnan(a), axis=0)  # number of valid values per column
+    if a.shape[0] == 0:
+        return np.full((len(quantiles),) + a.shape[1:], np.nan)
+    pos = np.multiply.outer(quantiles, np.maximum(n - 1, 0))  # position of the quantile among the valid values
+    lo = np.floor(pos).astype(np.intp)
+    hi = np.minimum(lo + 1, np.maximum(n - 1, 0))
+    v_lo = np.take_along_axis(a, lo, axis=0)
+    v_hi = np.take_along_axis(a, hi, axis=0)
+    # interpolate from the nearer neighbour, as numpy does. This also gives the same result for inf values.
+    t = pos - lo
+    with np.errstate(invalid='ignore'):  # inf - inf
+        diff = v_hi - v_lo
+        q = np.where(t >= 0.5, v_hi - diff * (1 - t), v_lo + diff * t)
+    return np.where(n > 0, q, np.nan)
 
 
 def get_plot_extent(df, grid=False):
@@ -446,10 +544,16 @@ def get_plot_extent(df, grid=False):
     if grid:
         x_min, x_max, dx, len_x = _get_grid(df[lon])
         y_min, y_max, dy, len_y = _get_grid(df[lat])
-        extent = [x_min-dx/2., x_max+dx/2., y_min-dx/2., y_max+dx/2.]
+        extent = [x_min-dx/2., x_max+dx/2., y_min-dy/2., y_max+dy/2.]
     else:
-        extent = [df[lon].min(), df[lon].max(),
-                  df[lat].min(), df[lat].max()]
+        coords = df[[lon, lat]].to_numpy()
+        (x_min, y_min), (x_max, y_max) = np.nanmin(coords, axis=0), np.nanmax(coords, axis=0)
+        extent = [x_min, x_max, y_min, y_max]
+    return _pad_extent(extent)
+
+
+def _pad_extent(extent):
+    "Pad extent [x_min, x_max, y_min, y_max] by globals.map_pad and clip it to the globe."
     dx = extent[1] - extent[0]
     dy = extent[3] - extent[2]
     # set map-padding around data to be globals.map_pad percent of the smaller dimension
@@ -469,6 +573,12 @@ def get_plot_extent(df, grid=False):
     return extent
 
 
+@functools.lru_cache(maxsize=64)
+def _get_cmap(name):
+    "Cached matplotlib.pyplot.cm.get_cmap, so the colormap is looked up only once per name."
+    return plt.cm.get_cmap(name)
+
+
 def init_plot(figsize, dpi, add_cbar, projection):
     if not projection:
         projection=globals.crs
@@ -512,7 +622,7 @@ def get_extend_cbar(metric):
             return 'neither'
 
 
-def _make_cbar(fig, im, cax, ds, v_min, v_max, meta, label=None):
+def _make_cbar(fig, im, cax, meta, label=None):
     metric = meta['metric']
     ref = meta['ref']
     if not label:
@@ -543,6 +653,20 @@ def _make_title(ax, meta=None, title=None, title_pad=globals.title_pad):
     ax.set_title(title, pad=title_pad)
 
 
+@functools.lru_cache(maxsize=None)
+def _ne_feature(category, name, resolution, edgecolor, facecolor):
+    "Cached cartopy.feature.NaturalEarthFeature, so the same feature object is reused by all maps."
+    return cfeature.NaturalEarthFeature(category, name, resolution,
+                                        edgecolor=edgecolor, facecolor=facecolor)
+
+
+def _get_ticks(start, interval, lower, upper):
+    "Return the ticks start + n*interval that lie within [lower, upper]."
+    n_min = np.ceil((lower - start) / interval - 1e-9)  # tolerance keeps ticks that lie on the boundary
+    n_max = np.floor((upper - start) / interval + 1e-9)
+    return start + interval * np.arange(n_min, n_max + 1)
+
+
 def style_map(ax, plot_extent, add_grid=True, map_resolution=globals.naturalearth_resolution,
               add_topo=False, add_coastline=True,
               add_land=True, add_borders=True, add_us_states=False):
@@ -553,8 +677,8 @@ def style_map(ax, plot_extent, add_grid=True, map_resolution=globals.naturaleart
         # https://github.com/SciTools/cartopy/issues/1342
         grid_interval = max((plot_extent[1] - plot_extent[0]),
                             (plot_extent[3] - plot_extent[2])) / 5  # create apprx. 5 gridlines in the bigger dimension
-        grid_interval = min(globals.grid_intervals, key=lambda x: abs(
-            x - grid_interval))  # select the grid spacing from the list which fits best
+        # select the grid spacing from the list which fits best
+        grid_interval = _grid_intervals[np.argmin(np.abs(_grid_intervals - grid_interval))]
         gl = ax.gridlines(crs=globals.data_crs, draw_labels=False,
                           linewidth=0.5, color='grey', linestyle='--',
                           zorder=3)  # draw only gridlines.
@@ -566,8 +690,8 @@ def style_map(ax, plot_extent, add_grid=True, map_resolution=globals.naturaleart
             gltext = ax.gridlines(crs=globals.data_crs, draw_labels=True,
                                   linewidth=0.5, color='grey', alpha=0., linestyle='--',
                                   zorder=4)  # draw only grid labels.
-            xticks = xticks[(xticks >= plot_extent[0]) & (xticks <= plot_extent[1])]
-            yticks = yticks[(yticks >= plot_extent[2]) & (yticks <= plot_extent[3])]
+            xticks = _get_ticks(-180, grid_interval, plot_extent[0], plot_extent[1])
+            yticks = _get_ticks(-90, grid_interval, plot_extent[2], plot_extent[3])
             gltext.xformatter = LONGITUDE_FORMATTER
             gltext.yformatter = LATITUDE_FORMATTER
             gltext.xlabels_top = False
@@ -579,19 +703,16 @@ def style_map(ax, plot_extent, add_grid=True, map_resolution=globals.naturaleart
     if add_topo:
         ax.stock_img()
     if add_coastline:
-        coastline = cfeature.NaturalEarthFeature('physical', 'coastline',
-                                                 map_resolution,
-                                                 edgecolor='black', facecolor='none')
+        coastline = _ne_feature('physical', 'coastline', map_resolution,
+                                edgecolor='black', facecolor='none')
         ax.add_feature(coastline, linewidth=0.4, zorder=3)
     if add_land:
-        land = cfeature.NaturalEarthFeature('physical', 'land',
-                                            map_resolution,
-                                            edgecolor='none', facecolor='white')
+        land = _ne_feature('physical', 'land', map_resolution,
+                           edgecolor='none', facecolor='white')
         ax.add_feature(land, zorder=1)
     if add_borders:
-        borders = cfeature.NaturalEarthFeature('cultural', 'admin_0_countries',
-                                               map_resolution,
-                                               edgecolor='black', facecolor='none')
+        borders = _ne_feature('cultural', 'admin_0_countries', map_resolution,
+                              edgecolor='black', facecolor='none')
         ax.add_feature(borders, linewidth=0.2, zorder=3)
     if add_us_states:
         ax.add_feature(cfeature.STATES, linewidth=0.1, zorder=3)
@@ -642,24 +763,19 @@ def make_watermark(fig, placement):
         pass
 
 
-def _get_globdict(meta):
-    globkeys = ['metric', 'ref', 'ref_pretty_name', 'ref_version', 'ref_version_pretty_name']
-    return {k: meta[k] for k in globkeys}
+_globkeys = ('metric', 'ref', 'ref_pretty_name', 'ref_version', 'ref_version_pretty_name')
 
 
 def _get_globmeta(varmeta):
     """
     get globmeta from varmeta and make sure it is consistent in itself.
     """
-    variter = iter(varmeta)
-    globmeta = _get_globdict(varmeta[next(variter)])
-    while True:  # for loop with iterator: compare if globmeta is universal among all variables
-        try:
-            var = next(variter)
-            if globmeta != _get_globdict(varmeta[var]):
-                raise Exception(
-                    'Global Metadata inconsistent among variables!\nglobmeta : {}\nvs.\nglobmeta(\'{}\') : {}'.format(
-                        globmeta, var, _get_globdict(varmeta[var])))
-        except StopIteration:
-            break
-    return globmeta
+    variter = iter(varmeta.items())
+    first_meta = next(variter)[1]
+    globvalues = tuple(first_meta[k] for k in _globkeys)
+    for var, meta in variter:  # compare if globmeta is universal among all variables
+        if tuple(meta[k] for k in _globkeys) != globvalues:
+            raise Exception(
+                'Global Metadata inconsistent among variables!\nglobmeta : {}\nvs.\nglobmeta(\'{}\') : {}'.format(
+                    dict(zip(_globkeys, globvalues)), var, {k: meta[k] for k in _globkeys}))
+    return dict(zip(_globkeys, globvalues))
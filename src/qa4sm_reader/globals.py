@@ -27,6 +27,9 @@ map_figsize = [11.32, 6.10]  # size of the output figure in inches.
 naturalearth_resolution = '110m'  # One of '10m', '50m' and '110m'. Finer resolution slows down plotting. see https://www.naturalearthdata.com/
 crs = ccrs.PlateCarree()  # projection. Must be a class from cartopy.crs. Note, that plotting labels does not work for most projections.
 markersize = 4  # diameter of Marker in points.
+markeredge_max_points = 5000  # scatterplots with more points are drawn without marker edges, which is much faster.
+rasterize_threshold = 50000  # scatterplots with more points are drawn as image, if the points lie on a regular grid.
+grid_min_coverage = 0.25  # fraction of the grid cells that need to hold a point, for the points to count as gridded.
 map_pad = 0.15  # padding relative to map height.
 grid_intervals = [0.25, 0.5, 1, 2, 5, 10, 30]  # grid spacing in degree to choose from (plotter will try to make 5 gridlines in the smaller dimension)
 max_title_len = 50  # maximum length of plot title in chars. if longer, it will be broken in multiple lines.
@@ -103,10 +103,10 @@ def plot_all(filepath, metrics=None, extent=None, out_dir=None, out_type='png',
             os.makedirs(curr_dir)
         for ending in out_type:
             fname = os.path.join(curr_dir, out_name+ending)
-            plt.savefig(fname, dpi='figure')
+            fig.savefig(fname, dpi='figure')
             fnames.append(fname)
 
-        plt.close()
+        plt.close(fig)
 
         # === mapplot ===
         for var in varmeta:
@@ -128,10 +128,10 @@ def plot_all(filepath, metrics=None, extent=None, out_dir=None, out_type='png',
 
             for ending in out_type:
                 fname = os.path.join(curr_dir, out_name+ending)
-                plt.savefig(fname, dpi='figure')
+                fig.savefig(fname, dpi='figure')
                 fnames.append(fname)
 
-            plt.close()
+            plt.close(fig)
 
     return fnames
 
@@ -191,9 +191,9 @@ def boxplot(filepath, metric, extent=None, out_dir=None, out_name=None, out_type
         os.makedirs(out_dir)
     for ending in out_type:
         fname = os.path.join(out_dir, out_name+ending)
-        plt.savefig(fname, dpi='figure')
+        fig.savefig(fname, dpi='figure')
         fnames.append(fname)
-    plt.close()
+    plt.close(fig)
     return fnames
 
 
@@ -264,9 +264,9 @@ def mapplot(filepath, var, extent=None, out_dir=None, out_name=None, out_type=No
             os.makedirs(out_dir)
         for ending in out_type:
             fname = os.path.join(out_dir, out_name+ending)
-            plt.savefig(fname, dpi='figure')
+            fig.savefig(fname, dpi='figure')
             fnames.append(fname)
-        plt.close()
+        plt.close(fig)
     return fnames
 
 
@@ -130,9 +130,9 @@ def df_qa4sm_integration():
                 # === save ===
                 png_filename = path.join(outfolder, 'boxplot_{}.png'.format(metric))
                 svg_filename = path.join(outfolder, 'boxplot_{}.svg'.format(metric))
-                plt.savefig(png_filename, dpi='figure')
-                plt.savefig(svg_filename)
-                plt.close()
+                fig.savefig(png_filename, dpi='figure')
+                fig.savefig(svg_filename)
+                plt.close(fig)
 
                 # === write to zip ===
                 arcname = path.basename(png_filename)
@@ -160,9 +160,9 @@ def df_qa4sm_integration():
                     png_filename = path.join(outfolder, filename + '.png')
                     svg_filename = path.join(outfolder, filename + '.svg')
 
-                    plt.savefig(png_filename, dpi='figure')
-                    plt.savefig(svg_filename)
-                    plt.close()
+                    fig.savefig(png_filename, dpi='figure')
+                    fig.savefig(svg_filename)
+                    plt.close(fig)
 
                     # === write to zip ===
                     arcname = path.basename(png_filename)
@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+
+
+__author__ = "Lukas Racbhauer"
+__copyright__ = "2019, TU Wien, Department of Geodesy and Geoinformation"
+__license__ = "mit"
+
+
+"""
+Contains testing code for the helper functions in dfplot.py
+"""
+
+
+from qa4sm_reader import dfplot
+import pandas as pd
+import numpy as np
+from matplotlib import cbook
+import warnings
+import pytest
+
+
+def test_geotraj_to_geo2d_float_noise():
+    # the stepsize found for this lon axis is 0.10000000000000142, truncating (lon - lon_min) / dlon
+    # would put e.g. the value of the 6th column into the 5th.
+    lon_idx = np.array([0, 6, 7, 8, 19, 20])
+    lon = 22.9 + 0.1 * (lon_idx + 8)
+    lat_idx = np.array([0, 1])
+    lon, lat = np.meshgrid(lon, 0.5 * lat_idx)
+    data = np.arange(lon.size, dtype=np.float64)
+    df = pd.DataFrame({'lat': lat.ravel(), 'lon': lon.ravel(), 'var': data})
+    zz, data_extent = dfplot.geotraj_to_geo2d(df, 'var')
+    assert zz.shape == (2, 21)
+    assert np.nansum(zz) == df['var'].sum()
+    exp_zz = np.full((2, 21), np.nan)
+    exp_zz[np.ix_(lat_idx, lon_idx)] = data.reshape(2, 6)  # every value in its own cell
+    np.testing.assert_array_equal(zz, exp_zz)
+
+
+def test_float_gcd():
+    assert dfplot._float_gcd(0.75, 0.5) == 0.25
+    assert dfplot._float_gcd(3., 2.) == 1.
+
+
+def test_get_grid_missing_row():
+    # all stepsizes are multiple of the smallest one.
+    a = np.array([0., 0.25, 0.5, 1., 2., 2.])
+    assert dfplot._get_grid(a) == (0., 2., 0.25, 9)
+
+
+def test_get_grid_irregular_steps():
+    # stepsizes 0.5 and 0.75 are no multiple of each other: the grid spacing is their gcd.
+    a = np.array([0., 0.5, 1.25, 2.])
+    assert dfplot._get_grid(a) == (0., 2., 0.25, 9)
+
+
+def test_get_bxpstats():
+    rng = np.random.RandomState(0)
+    arr = rng.normal(size=(500, 3))
+    arr[rng.random_sample(arr.shape) < 0.1] = np.nan  # nan values in all columns
+    arr[0, 0] = 10.  # outlier outside the whiskers
+    bxpstats = dfplot._get_bxpstats(arr)
+    assert len(bxpstats) == 3
+    for i, stats in enumerate(bxpstats):
+        exp_stats = cbook.boxplot_stats(arr[~np.isnan(arr[:, i]), i])[0]
+        for key in ('med', 'q1', 'q3', 'whislo', 'whishi'):
+            assert np.isclose(stats[key], exp_stats[key])
+
+
+def test_get_bxpstats_all_nan():
+    arr = np.array([[1., np.nan], [2., np.nan], [3., np.nan]])
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')  # no 'All-NaN slice encountered' warnings
+        bxpstats = dfplot._get_bxpstats(arr)
+    assert bxpstats[0]['med'] == 2.
+    assert all(np.isnan(bxpstats[1][key]) for key in ('med', 'q1', 'q3', 'whislo', 'whishi'))
+
+
+def test_get_ticks():
+    np.testing.assert_allclose(dfplot._get_ticks(-180, 0.25, -10., -9.), [-10., -9.75, -9.5, -9.25, -9.])
+    np.testing.assert_allclose(dfplot._get_ticks(-90, 30, -89., 89.), [-60., -30., 0., 30., 60.])
+    # boundaries that are not exactly on a tick because of float noise.
+    np.testing.assert_allclose(dfplot._get_ticks(-180, 0.1, 0.1 * 3, 0.1 * 7), [0.3, 0.4, 0.5, 0.6, 0.7])
+
+
+def _get_thinned_grid(fraction, seed=0):
+    "Points of a 0.25 degree grid, of which only fraction is kept."
+    lon, lat = np.meshgrid(np.arange(-10, 10, 0.25), np.arange(40, 50, 0.25))
+    keep = np.random.RandomState(seed).random_sample(lon.shape) < fraction
+    return pd.DataFrame({'lat': lat[keep], 'lon': lon[keep], 'var': np.arange(keep.sum(), dtype=np.float64)})
+
+
+def test_is_gridded():
+    df = _get_thinned_grid(0.5)
+    grids = dfplot._is_gridded(df)
+    assert grids == ((-10., 9.75, 0.25, 80), (40., 49.75, 0.25, 40))
+    # the grids can be passed on to geotraj_to_geo2d
+    zz, data_extent = dfplot.geotraj_to_geo2d(df, 'var', grids=grids)
+    exp_zz, exp_data_extent = dfplot.geotraj_to_geo2d(df, 'var')
+    np.testing.assert_array_equal(zz, exp_zz)
+    assert data_extent == exp_data_extent
+
+
+def test_is_gridded_coverage(monkeypatch):
+    monkeypatch.setattr(dfplot.globals, 'grid_min_coverage', 0.25)
+    assert dfplot._is_gridded(_get_thinned_grid(0.1)) is None
+    monkeypatch.setattr(dfplot.globals, 'grid_min_coverage', 0.05)
+    assert dfplot._is_gridded(_get_thinned_grid(0.1)) is not None
+
+
+def test_is_gridded_scattered():
+    rng = np.random.RandomState(1)
+    df = pd.DataFrame({'lat': rng.uniform(30, 40, 2000), 'lon': rng.uniform(-120, -110, 2000)})
+    assert dfplot._is_gridded(df) is None
+
+
+QUANTILES = [0.025, 0.975]
+
+
+def _get_nan_data(shape, seed=0):
+    rng = np.random.RandomState(seed)
+    a = rng.normal(size=shape)
+    a[rng.random_sample(shape) < 0.2] = np.nan
+    return a
+
+
+@pytest.mark.parametrize('a', [
+    _get_nan_data((1,)),
+    _get_nan_data((500,)),
+    _get_nan_data((7, 3)),
+    _get_nan_data((300, 6)).astype(np.float32),
+    np.array([[1., np.nan], [2., np.nan], [4., np.nan]]),  # all-nan column
+    np.array([1., np.inf, 2., 3.]),
+    np.array([[3, 1], [2, 5], [7, 4]]),  # integers
+])
+def test_nanquantile(a):
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', category=RuntimeWarning)
+        exp_q = np.nanquantile(a, QUANTILES, axis=0)
+    np.testing.assert_allclose(dfplot._nanquantile(a, QUANTILES), exp_q, rtol=1e-6)
+
+
+def test_nanquantile_empty():
+    q = dfplot._nanquantile(np.zeros((0, 2)), QUANTILES)
+    assert q.shape == (2, 2)
+    assert np.isnan(q).all()
+
+
+def test_get_quantiles():
+    a = _get_nan_data((300, 3))
+    a[:, 1] = np.nan  # all-nan column is ignored
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', category=RuntimeWarning)
+        exp_q = np.nanquantile(a, QUANTILES, axis=0)
+    exp_range = (np.nanmin(exp_q[0]), np.nanmax(exp_q[1]))
+    np.testing.assert_allclose(dfplot.get_quantiles(a, QUANTILES), exp_range)
+    np.testing.assert_allclose(dfplot.get_quantiles(pd.DataFrame(a), QUANTILES), exp_range)
+    np.testing.assert_allclose(dfplot.get_quantiles(pd.Series(a[:, 0]), QUANTILES), exp_q[:, 0])
+
+
+def test_get_quantiles_type():
+    with pytest.raises(TypeError):
+        dfplot.get_quantiles([1., 2., 3.], QUANTILES)
+
+
+def test_make_boxplot_title():
+    # two boxes: width 2 * boxplot_title_len
+    title = dfplot._make_boxplot_title('Comparing ISMN (20180712 global) to', ['ESA CCI SM combined', 'C3S'], 30)
+    assert title == 'Comparing ISMN (20180712 global) to\nESA CCI SM combined and C3S'
+    title = dfplot._make_boxplot_title('Comparing ISMN (20180712 global) to',
+                                       ['H-SAF ASCAT SSM CDR', 'ESA CCI SM combined'], 30)
+    assert title == 'Comparing ISMN (20180712 global) to\nH-SAF ASCAT SSM CDR and\nESA CCI SM combined'
+    # one box (n_obs): names are never split, not even at spaces or hyphens
+    title = dfplot._make_boxplot_title('Number of spacial and temporal matches between ISMN (20180712 global) and',
+                                       ['C3S', 'SMAP level 3', 'H-SAF ASCAT SSM CDR', 'ESA CCI SM combined'], 15)
+    assert title == ('Number of spacial and temporal matches between ISMN (20180712 global) and\n'
+                     'C3S,\nSMAP level 3,\nH-SAF ASCAT SSM CDR\nand\nESA CCI SM combined')
+    assert dfplot._make_boxplot_title('Comparing ISMN (v) to', ['C3S'], 15) == 'Comparing ISMN (v) to\nC3S'
@@ -11,8 +11,6 @@ Contains testing code for ncplot.py
 
 Missing: 
 * rare cases in get_value_range()
-    * Gridded dataset with missing row/column, resulting in multiple stepsizes, 
-      which are handled in '_get_grid' and '_float_gcd'
     * metric not given to dfplot
     * metric not in globals
     * force quantile